@@ -10,19 +10,52 @@ the data to Excel, PDF, or CSV formats.
 """
 
 import argparse
+import contextlib
+import gzip
+import html
+import io
 import json
+import os
+import time
 import sys
+import tempfile
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+import numpy as np
 import pandas as pd
 import requests
-from io import BytesIO # Required for xhtml2pdf
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Attempt to import xhtml2pdf for PDF generation
+# orjson parses the API payload considerably faster than the stdlib json module;
+# fall back to json silently when it is not installed.
 try:
-    from xhtml2pdf import pisa
+    import orjson
 except ImportError:
-    pisa = None
-    print("Warning: xhtml2pdf library not found. PDF export will not be available. "
-          "Install it with 'pip install xhtml2pdf'.", file=sys.stderr)
+    orjson = None
+
+# zstandard gives smaller, faster-to-read cache files; gzip is used when it is missing
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# PyArrow's C++ CSV writer is much faster than DataFrame.to_csv on wide frames
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# With PyArrow available, let pandas store inferred text columns as Arrow-backed
+# strings (pandas >= 2.1; the default from pandas 3.0), including category labels
+if pa is not None:
+    try:
+        pd.set_option('future.infer_string', True)
+    except KeyError: # pandas raises OptionError (a KeyError) when the option does not exist
+        pass
 
 # --- Configuration ---
 BASE_URL = "https://cutoff.tneaonline.org/api/auth/glist/"
@@ -35,6 +68,18 @@ YEAR_TO_API_CODE = {
 }
 API_CODE_TO_YEAR = {v: k for k, v in YEAR_TO_API_CODE.items()}
 
+# Raw API responses are cached on disk; past years never change, while the
+# current year is re-downloaded once its cache entry is older than the TTL
+CACHE_DIR = Path.home() / ".cache" / "tnea"
+CURRENT_YEAR_CACHE_TTL = 24 * 60 * 60 # seconds
+CURRENT_YEAR_API_CODE = YEAR_TO_API_CODE[max(YEAR_TO_API_CODE)]
+
+# Shared HTTP session so repeated fetches reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                      max_retries=Retry(total=3, backoff_factor=0.3)))
+
 # Define the columns and their new names for the DataFrame
 COLUMN_MAPPING = {
     'coc': 'College Code',
@@ -64,46 +109,170 @@ COLUMN_MAPPING = {
     'stal': 'ST Allotted Seats'
 }
 
+# Leading column added when several years are combined
+YEAR_COLUMN = 'Year'
+
+# API fields to load, in canonical output order
+RAW_COLUMNS = list(COLUMN_MAPPING.keys())
+
+# Lowercased mapped names, API keys and the Year column for resolving --sort-by, computed once
+SORT_COLUMN_LOOKUP = {
+    **{mapped.lower(): mapped for mapped in COLUMN_MAPPING.values()},
+    **{original.lower(): mapped for original, mapped in COLUMN_MAPPING.items()},
+    YEAR_COLUMN.lower(): YEAR_COLUMN,
+}
+SORT_COLUMN_CANDIDATES = [(original.lower(), mapped.lower(), mapped) for original, mapped in COLUMN_MAPPING.items()]
+
 CUTOFF_COLUMNS = ['OC Cutoff', 'BC Cutoff', 'BCM Cutoff', 'MBC Cutoff', 'SC Cutoff', 'SCA Cutoff', 'ST Cutoff']
+SEAT_COLUMNS = [col for col in COLUMN_MAPPING.values() if 'Seats' in col]
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ['College Name', 'Branch Code', 'Branch Name']
+
+# Serializes status output from fetch worker threads so lines do not interleave
+PRINT_LOCK = threading.Lock()
 
 # --- Helper Functions ---
 
-def fetch_tnea_data(year_api_code: str) -> list:
+def print_locked(*args, **kwargs):
+    """Prints while holding PRINT_LOCK; used by code that runs on worker threads."""
+    with PRINT_LOCK:
+        print(*args, **kwargs)
+
+def parse_json(content: bytes) -> list:
+    """Parses a JSON payload, using orjson when it is available."""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch either
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def get_cache_path(year_api_code: str) -> Path:
+    """Returns the on-disk cache file for a year API code."""
+    suffix = ".json.zst" if zstandard is not None else ".json.gz"
+    return CACHE_DIR / f"{year_api_code}{suffix}"
+
+def load_cached_response(year_api_code: str) -> list:
+    """
+    Loads a cached API response for a given year API code.
+
+    Args:
+        year_api_code (str): The API code for the year (e.g., '1C', '2C').
+
+    Returns:
+        list: The cached cutoff data, or None if there is no usable cache entry.
+    """
+    cache_path = get_cache_path(year_api_code)
+    try:
+        if (year_api_code == CURRENT_YEAR_API_CODE
+                and time.time() - cache_path.stat().st_mtime > CURRENT_YEAR_CACHE_TTL):
+            return None
+        compressed = cache_path.read_bytes()
+        if zstandard is not None:
+            content = zstandard.ZstdDecompressor().decompress(compressed)
+        else:
+            content = gzip.decompress(compressed)
+        data = parse_json(content)
+        # Only a non-empty record list is a usable entry
+        return data if isinstance(data, list) and data else None
+    except FileNotFoundError:
+        return None
+    except Exception as e: # A corrupt cache entry is ignored and replaced by a fresh download
+        print_locked(f"Warning: Ignoring unreadable cache file {cache_path}: {e}", file=sys.stderr)
+        return None
+
+def save_cached_response(year_api_code: str, content: bytes):
+    """Compresses and stores a raw API response in the on-disk cache."""
+    cache_path = get_cache_path(year_api_code)
+    try:
+        if zstandard is not None:
+            compressed = zstandard.ZstdCompressor(level=3).compress(content)
+        else:
+            compressed = gzip.compress(content)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_bytes(compressed)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        print_locked(f"Warning: Could not write cache file {cache_path}: {e}", file=sys.stderr)
+
+def fetch_tnea_data(year_api_code: str, refresh: bool = False, cache_executor: Executor = None) -> list:
     """
     Fetches TNEA cutoff data for a given year API code.
+    Uses the on-disk cache when possible and stores fresh downloads in it.
 
     Args:
         year_api_code (str): The API code for the year (e.g., '1C', '2C').
+        refresh (bool): Ignore any cached response and download the data again.
+        cache_executor (Executor): If given, the cache write runs on it in the background.
 
     Returns:
         list: A list of dictionaries containing the cutoff data, or None if an error occurs.
     """
+    if not refresh:
+        cached_data = load_cached_response(year_api_code)
+        if cached_data is not None:
+            print_locked(f"Using cached data from: {get_cache_path(year_api_code)}")
+            return cached_data
+
     url = f"{BASE_URL}{year_api_code}"
     try:
-        print(f"Fetching data from: {url}")
-        response = requests.get(url, timeout=30) # Added timeout
+        print_locked(f"Fetching data from: {url}")
+        response = SESSION.get(url, timeout=(5, 30)) # (connect, read) timeouts
         response.raise_for_status()  # Raises an HTTPError for bad responses (4XX or 5XX)
-        return response.json()
+        data = parse_json(response.content)
+        # The API returns a list of records; anything else (e.g. {"message": "Unauthorized"}) is an error
+        if not isinstance(data, list):
+            print_locked(f"Unexpected response from API: {response.text[:200]}... - URL: {url}", file=sys.stderr)
+            return None
+        # Only cache non-empty record lists, so empty payloads are never served from the
+        # cache later; compressing and writing can overlap with processing
+        if data:
+            if cache_executor is not None:
+                cache_executor.submit(save_cached_response, year_api_code, response.content)
+            else:
+                save_cached_response(year_api_code, response.content)
+        return data
     except requests.exceptions.HTTPError as http_err:
-        print(f"HTTP error occurred: {http_err} - URL: {url}", file=sys.stderr)
-        if response.status_code == 401:
-             print("This might be due to an authorization issue or an invalid API endpoint.", file=sys.stderr)
-        elif response.status_code == 404:
-             print("The requested resource was not found. Check the year/API code.", file=sys.stderr)
+        # Hold the lock across both lines so another year's output cannot land between them
+        with PRINT_LOCK:
+            print(f"HTTP error occurred: {http_err} - URL: {url}", file=sys.stderr)
+            if response.status_code == 401:
+                 print("This might be due to an authorization issue or an invalid API endpoint.", file=sys.stderr)
+            elif response.status_code == 404:
+                 print("The requested resource was not found. Check the year/API code.", file=sys.stderr)
     except requests.exceptions.ConnectionError as conn_err:
-        print(f"Connection error occurred: {conn_err} - URL: {url}", file=sys.stderr)
+        print_locked(f"Connection error occurred: {conn_err} - URL: {url}", file=sys.stderr)
     except requests.exceptions.Timeout as timeout_err:
-        print(f"Timeout error occurred: {timeout_err} - URL: {url}", file=sys.stderr)
+        print_locked(f"Timeout error occurred: {timeout_err} - URL: {url}", file=sys.stderr)
     except requests.exceptions.RequestException as req_err:
-        print(f"An error occurred during the request: {req_err} - URL: {url}", file=sys.stderr)
+        print_locked(f"An error occurred during the request: {req_err} - URL: {url}", file=sys.stderr)
     except json.JSONDecodeError as json_err:
-        print(f"Failed to decode JSON response: {json_err}. Response text: {response.text[:200]}...", file=sys.stderr)
+        print_locked(f"Failed to decode JSON response: {json_err}. Response text: {response.text[:200]}...", file=sys.stderr)
     return None
 
+def fetch_tnea_data_many(year_api_codes: list, refresh: bool = False, cache_executor: Executor = None) -> dict:
+    """
+    Fetches TNEA cutoff data for several year API codes concurrently.
+    The requests share the pooled session, so their network round-trips overlap.
+
+    Args:
+        year_api_codes (list): The API codes to fetch (e.g., ['1C', '2C']).
+        refresh (bool): Ignore any cached responses and download the data again.
+        cache_executor (Executor): If given, cache writes run on it in the background.
+
+    Returns:
+        dict: Maps each API code to its data, or to None if that fetch failed.
+    """
+    if len(year_api_codes) == 1:
+        return {year_api_codes[0]: fetch_tnea_data(year_api_codes[0], refresh, cache_executor)}
+
+    with ThreadPoolExecutor(max_workers=min(len(year_api_codes), 4)) as executor:
+        return dict(zip(year_api_codes, executor.map(partial(fetch_tnea_data, refresh=refresh, cache_executor=cache_executor), year_api_codes)))
+
 def process_data(raw_data: list) -> pd.DataFrame:
     """
     Processes the raw JSON data into a pandas DataFrame.
-    - Removes the '_id' column.
+    - Keeps only the known API fields, in canonical order (dropping '_id').
     - Renames columns to be more user-friendly.
     - Converts cutoff columns to numeric types, coercing errors.
 
@@ -116,38 +285,55 @@ def process_data(raw_data: list) -> pd.DataFrame:
     if not raw_data:
         return pd.DataFrame()
 
-    df = pd.DataFrame(raw_data)
-
-    # Remove the '_id' column if it exists
-    if '_id' in df.columns:
-        df = df.drop(columns=['_id'])
+    # Build the frame with the static schema up front: pandas skips inferring the
+    # column set from every record, and missing fields come back as NaN
+    df = pd.DataFrame.from_records(raw_data, columns=RAW_COLUMNS)
 
     # Rename columns
     df = df.rename(columns=COLUMN_MAPPING)
 
-    # Ensure all defined columns exist, add if missing (with NaN)
-    for new_col_name in COLUMN_MAPPING.values():
-        if new_col_name not in df.columns:
-            df[new_col_name] = pd.NA # Use pandas NA for missing values
+    # Normalize non-numeric college codes to strings once so filters compare them directly
+    if not pd.api.types.is_numeric_dtype(df['College Code']):
+        df['College Code'] = df['College Code'].astype('string[pyarrow]' if pa is not None else 'string')
 
-    # Convert cutoff columns to numeric, handling potential errors (e.g., empty strings for ST)
-    for col in CUTOFF_COLUMNS:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-    
-    # Convert seat count columns to numeric (integer), handling potential errors
-    seat_cols = [col for col in COLUMN_MAPPING.values() if 'Seats' in col and col not in CUTOFF_COLUMNS]
-    for col in seat_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64') # Use Int64 to support NaN
+    # A few hundred colleges and branches repeat across thousands of rows, so store
+    # them as categoricals; comparisons, sorting and de-duplication then use codes
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS})
 
-    # Reorder columns to match COLUMN_MAPPING order + any extra ones at the end
-    ordered_columns = [col for col in COLUMN_MAPPING.values() if col in df.columns]
-    extra_columns = [col for col in df.columns if col not in ordered_columns]
-    df = df[ordered_columns + extra_columns]
+    # Convert cutoff and seat count columns to numeric in a single pass, coercing
+    # errors (e.g., empty strings for ST); seat counts use Int64 to support NaN
+    # Columns the API already returned as numbers are skipped
+    text_columns = [col for col in CUTOFF_COLUMNS + SEAT_COLUMNS if not pd.api.types.is_numeric_dtype(df[col])]
+    if text_columns:
+        df[text_columns] = df[text_columns].apply(pd.to_numeric, errors='coerce')
+    df = df.astype({col: 'Int64' for col in SEAT_COLUMNS})
 
     return df
 
+def categorical_mask(column: pd.Series, category_hits: np.ndarray) -> np.ndarray:
+    """
+    Maps a per-category boolean array back to the rows of a categorical column.
+
+    Args:
+        column (pd.Series): A categorical column.
+        category_hits (np.ndarray): One boolean per category, in category order.
+
+    Returns:
+        np.ndarray: A boolean mask with one entry per row (False for missing values).
+    """
+    # The trailing False is picked up by the -1 code of missing values
+    return np.append(category_hits, False)[column.cat.codes.to_numpy()]
+
+def categorical_equals(column: pd.Series, value: str) -> np.ndarray:
+    """Case-insensitive equality test on a categorical column, comparing each distinct category once."""
+    categories = column.cat.categories.to_numpy(dtype=str)
+    return categorical_mask(column, np.char.upper(categories) == value.upper())
+
+def categorical_contains(column: pd.Series, substring: str) -> np.ndarray:
+    """Case-insensitive substring match on a categorical column, searching each distinct category once."""
+    categories = column.cat.categories.to_numpy(dtype=str)
+    return categorical_mask(column, np.char.find(np.char.lower(categories), substring.lower()) >= 0)
+
 def apply_filters(df: pd.DataFrame, args: argparse.Namespace) -> pd.DataFrame:
     """
     Applies filters to the DataFrame based on CLI arguments.
@@ -162,21 +348,31 @@ def apply_filters(df: pd.DataFrame, args: argparse.Namespace) -> pd.DataFrame:
     if df.empty:
         return df
 
-    # College Code filter
+    # Collect every active predicate as a boolean array and slice the frame once
+    # at the end, instead of materializing an intermediate DataFrame per filter.
+    masks = []
+
+    # College Code filter; the argument is converted once to the column's type instead of
+    # casting the whole column to strings
     if args.filter_college_code:
-        df = df[df['College Code'].astype(str) == str(args.filter_college_code)]
+        college_codes = df['College Code']
+        if pd.api.types.is_numeric_dtype(college_codes):
+            target_code = pd.to_numeric(args.filter_college_code, errors='coerce') # NaN never matches
+        else:
+            target_code = str(args.filter_college_code)
+        masks.append((college_codes == target_code).to_numpy(dtype=bool, na_value=False))
 
     # College Name filter (case-insensitive, contains)
     if args.filter_college_name:
-        df = df[df['College Name'].str.contains(args.filter_college_name, case=False, na=False)]
+        masks.append(categorical_contains(df['College Name'], args.filter_college_name))
 
     # Branch Code filter
     if args.filter_branch_code:
-        df = df[df['Branch Code'].str.upper() == args.filter_branch_code.upper()]
+        masks.append(categorical_equals(df['Branch Code'], args.filter_branch_code))
 
     # Branch Name filter (case-insensitive, contains)
     if args.filter_branch_name:
-        df = df[df['Branch Name'].str.contains(args.filter_branch_name, case=False, na=False)]
+        masks.append(categorical_contains(df['Branch Name'], args.filter_branch_name))
 
     # Min/Max Cutoff filters for each community
     for community_key, cutoff_col_name in [
@@ -187,15 +383,39 @@ def apply_filters(df: pd.DataFrame, args: argparse.Namespace) -> pd.DataFrame:
         max_cutoff_arg = getattr(args, f"max_{community_key}_cutoff", None)
 
         if min_cutoff_arg is not None:
-            df = df[df[cutoff_col_name] >= min_cutoff_arg]
+            masks.append((df[cutoff_col_name] >= min_cutoff_arg).to_numpy(dtype=bool, na_value=False))
         if max_cutoff_arg is not None:
-            df = df[df[cutoff_col_name] <= max_cutoff_arg]
-            
-    return df
+            masks.append((df[cutoff_col_name] <= max_cutoff_arg).to_numpy(dtype=bool, na_value=False))
+
+    if not masks:
+        return df
+
+    return df.iloc[np.logical_and.reduce(masks)]
+
+def find_sort_column(sort_by: str) -> str:
+    """
+    Resolves a user-supplied sort column to its mapped column name.
+
+    Args:
+        sort_by (str): A mapped column name or original API key, or part of one (case-insensitive).
+
+    Returns:
+        str: The mapped column name, or None if nothing matches.
+    """
+    key = sort_by.lower()
+    # Exact (case-insensitive) mapped names and API keys are a single dict lookup
+    if key in SORT_COLUMN_LOOKUP:
+        return SORT_COLUMN_LOOKUP[key]
+    # Fall back to a partial match for user-friendliness
+    for original_lower, mapped_lower, mapped in SORT_COLUMN_CANDIDATES:
+        if key in mapped_lower or key in original_lower:
+            return mapped
+    return None
 
 def apply_sorting(df: pd.DataFrame, args: argparse.Namespace) -> pd.DataFrame:
     """
-    Applies sorting to the DataFrame based on CLI arguments.
+    Applies sorting to the DataFrame based on CLI arguments, keeping only the
+    first --top rows when that option is given.
 
     Args:
         df (pd.DataFrame): The DataFrame to sort.
@@ -205,29 +425,22 @@ def apply_sorting(df: pd.DataFrame, args: argparse.Namespace) -> pd.DataFrame:
         pd.DataFrame: The sorted DataFrame.
     """
     if df.empty or not args.sort_by:
-        return df
-
-    sort_column_actual_name = None
-    # Find the actual column name (case-insensitive partial match for user-friendliness)
-    # First, try exact match with mapped names
-    if args.sort_by in COLUMN_MAPPING.values():
-        sort_column_actual_name = args.sort_by
-    else: # Try partial case-insensitive match
-        for k, v in COLUMN_MAPPING.items():
-            if args.sort_by.lower() in v.lower() or args.sort_by.lower() in k.lower() :
-                sort_column_actual_name = v
-                break
-        if not sort_column_actual_name: # Fallback to check original keys if user used one
-             if args.sort_by in COLUMN_MAPPING.keys():
-                 sort_column_actual_name = COLUMN_MAPPING[args.sort_by]
+        return df.head(args.top) if args.top else df
 
+    sort_column_actual_name = find_sort_column(args.sort_by)
 
     if not sort_column_actual_name or sort_column_actual_name not in df.columns:
         print(f"Warning: Sort column '{args.sort_by}' not found. Available columns: {', '.join(df.columns)}", file=sys.stderr)
-        return df
+        return df.head(args.top) if args.top else df
 
     ascending_order = args.sort_order == 'asc'
     try:
+        if args.top and sort_column_actual_name in CUTOFF_COLUMNS:
+            # Partial selection of the top rows instead of a full sort; rows without a cutoff are left out
+            if ascending_order:
+                return df.nsmallest(args.top, sort_column_actual_name)
+            return df.nlargest(args.top, sort_column_actual_name)
+
         # When sorting by cutoff, NaNs should ideally be last
         na_position = 'last' if ascending_order else 'first' # For descending, NaNs first might be better
         if sort_column_actual_name in CUTOFF_COLUMNS:
@@ -236,13 +449,20 @@ def apply_sorting(df: pd.DataFrame, args: argparse.Namespace) -> pd.DataFrame:
              df = df.sort_values(by=sort_column_actual_name, ascending=ascending_order, na_position='last')
     except Exception as e:
         print(f"Error sorting by column '{sort_column_actual_name}': {e}", file=sys.stderr)
-    return df
+    return df.head(args.top) if args.top else df
+
+def fill_missing_for_display(df: pd.DataFrame, value: str) -> pd.DataFrame:
+    """Fills missing values for export, widening categorical and Int64 columns so they accept the filler."""
+    typed_columns = df.select_dtypes(['category', 'Int64']).columns
+    if len(typed_columns):
+        df = df.astype({col: object for col in typed_columns})
+    return df.fillna(value)
 
 def save_to_excel(df: pd.DataFrame, filename: str):
     """Saves the DataFrame to an Excel file."""
     try:
         # Fill NaN values with 'N/A' for better readability in Excel
-        df_display = df.fillna('N/A')
+        df_display = fill_missing_for_display(df, 'N/A')
         df_display.to_excel(filename, index=False, engine='openpyxl')
         print(f"Data successfully saved to {filename}")
     except Exception as e:
@@ -251,61 +471,165 @@ def save_to_excel(df: pd.DataFrame, filename: str):
 def save_to_csv(df: pd.DataFrame, filename: str):
     """Saves the DataFrame to a CSV file."""
     try:
-        # Fill NaN values with empty string for CSV or 'N/A'
-        df_display = df.fillna('') # Or 'N/A'
-        df_display.to_csv(filename, index=False)
+        if pa is not None:
+            # Arrow writes missing values as empty fields, so no fillna pass is needed
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, filename, pacsv.WriteOptions(include_header=True))
+        else:
+            # Fill NaN values with empty string for CSV or 'N/A'
+            df_display = fill_missing_for_display(df, '') # Or 'N/A'
+            df_display.to_csv(filename, index=False)
         print(f"Data successfully saved to {filename}")
     except Exception as e:
         print(f"Error saving to CSV file {filename}: {e}", file=sys.stderr)
 
+def escape_html(column: pd.Series) -> pd.Series:
+    """Escapes HTML special characters in a column of strings."""
+    return (column.str.replace("&", "&amp;", regex=False)
+                  .str.replace("<", "&lt;", regex=False)
+                  .str.replace(">", "&gt;", regex=False))
+
+def iter_html_table(df: pd.DataFrame, chunk_rows: int = 1000):
+    """
+    Yields the HTML table for the DataFrame piece by piece. Rows are rendered a
+    chunk at a time with vectorized string concatenation, which is much faster
+    than DataFrame.to_html and never holds the whole table as one string.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to render.
+        chunk_rows (int): Number of rows rendered per yielded piece.
+
+    Yields:
+        str: Consecutive fragments of the HTML table markup.
+    """
+    header = "".join(f"<th>{html.escape(str(col), quote=False)}</th>" for col in df.columns)
+    yield f'<table class="dataframe"><thead><tr>{header}</tr></thead><tbody>'
+    for start in range(0, len(df), chunk_rows):
+        # Fill NaN values for display one chunk at a time
+        chunk = fill_missing_for_display(df.iloc[start:start + chunk_rows], 'N/A')
+        cells = [escape_html(chunk[col].astype(str)) for col in chunk.columns]
+        rows = "<tr><td>" + cells[0].str.cat(cells[1:], sep="</td><td>") + "</td></tr>"
+        yield "".join(rows.tolist())
+    yield "</tbody></table>"
+
+@lru_cache(maxsize=None)
+def get_pdf_backend() -> tuple:
+    """
+    Imports the PDF backend on first use, so runs that never export a PDF do not pay
+    for it. WeasyPrint is preferred, since its native renderer is much faster on large
+    tables; xhtml2pdf is used as a fallback when it is unavailable.
+
+    Returns:
+        tuple: (WeasyPrint HTML class, xhtml2pdf pisa module); at most one is set,
+        and both are None when neither library is installed.
+    """
+    try:
+        # WeasyPrint prints an installation banner to stdout when its native libraries
+        # are missing; keep it out of the tool's output
+        with contextlib.redirect_stdout(io.StringIO()):
+            from weasyprint import HTML as WeasyHTML
+        return WeasyHTML, None
+    except (ImportError, OSError): # OSError when the Pango/Cairo system libraries are missing
+        pass
+
+    try:
+        from xhtml2pdf import pisa
+        return None, pisa
+    except ImportError:
+        print("Warning: Neither WeasyPrint nor xhtml2pdf was found. PDF export will not be available. "
+              "Install one with 'pip install weasyprint' or 'pip install xhtml2pdf'.", file=sys.stderr)
+        return None, None
+
 def save_to_pdf(df: pd.DataFrame, filename: str):
-    """Saves the DataFrame to a PDF file."""
-    if pisa is None:
-        print("PDF export is unavailable because xhtml2pdf is not installed.", file=sys.stderr)
+    """Saves the DataFrame to a PDF file, using WeasyPrint if available and xhtml2pdf otherwise."""
+    WeasyHTML, pisa = get_pdf_backend()
+    if WeasyHTML is None and pisa is None:
+        print("PDF export is unavailable because neither WeasyPrint nor xhtml2pdf is installed.", file=sys.stderr)
         return
 
-    try:
-        # Fill NaN values for display
-        df_display = df.fillna('N/A')
-        
+    if WeasyHTML is not None:
+        # WeasyPrint supports CSS paged media, so the header and page numbers are page margin boxes
+        html_head = """
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <style>
+                @page {
+                    size: A4 landscape;
+                    margin: 60pt 20pt 40pt 20pt;
+                    @top-center { content: "TNEA Cutoff Data"; font-size: 12pt; }
+                    @bottom-center { content: "Page " counter(page) " of " counter(pages); font-size: 7pt; }
+                }
+                body { font-family: "Helvetica", "Arial", sans-serif; font-size: 8pt; }
+                table { width: 100%; border-collapse: collapse; }
+                thead { display: table-header-group; }
+                th, td { border: 1px solid #dddddd; text-align: left; padding: 4px; }
+                th { background-color: #f2f2f2; }
+            </style>
+        </head>
+        <body>
+        """
+        html_tail = """
+        </body>
+        </html>
+        """
+    else:
         # Basic HTML styling for the PDF table
-        html_string = f"""
+        html_head = """
         <html>
         <head>
             <meta charset="UTF-8">
             <style>
-                @page {{ 
+                @page { 
                     size: A4 landscape; 
-                    @frame header_frame {{
+                    @frame header_frame {
                         -pdf-frame-content: header_content;
                         left: 50pt; width: 512pt; top: 20pt; height: 50pt;
-                    }}
-                     @frame content_frame {{
+                    }
+                     @frame content_frame {
                         left: 20pt; width: 780pt; top: 90pt; height: 480pt; /* Adjusted for landscape */
-                    }}
-                    @frame footer_frame {{
+                    }
+                    @frame footer_frame {
                         -pdf-frame-content: footer_content;
                         left: 50pt; width: 512pt; top: 772pt; height: 20pt;
-                    }}
-                }}
-                body {{ font-family: "Helvetica", "Arial", sans-serif; font-size: 8pt; }}
-                table {{ width: 100%; border-collapse: collapse; }}
-                th, td {{ border: 1px solid #dddddd; text-align: left; padding: 4px; }}
-                th {{ background-color: #f2f2f2; }}
-                .header {{ text-align: center; font-size: 12pt; }}
-                .footer {{ text-align: center; font-size: 7pt; }}
+                    }
+                }
+                body { font-family: "Helvetica", "Arial", sans-serif; font-size: 8pt; }
+                table { width: 100%; border-collapse: collapse; }
+                th, td { border: 1px solid #dddddd; text-align: left; padding: 4px; }
+                th { background-color: #f2f2f2; }
+                .header { text-align: center; font-size: 12pt; }
+                .footer { text-align: center; font-size: 7pt; }
             </style>
         </head>
         <body>
             <div id="header_content" class="header">TNEA Cutoff Data</div>
-            {df_display.to_html(index=False, border=0)}
+        """
+        html_tail = """
             <div id="footer_content" class="footer">Page <pdf:pagenumber /> of <pdf:pagecount /></div>
         </body>
         </html>
         """
-        
-        with open(filename, "wb") as pdf_file:
-            pisa_status = pisa.CreatePDF(BytesIO(html_string.encode("UTF-8")), dest=pdf_file, encoding='UTF-8')
+
+    try:
+        # Stream the HTML into a spooled file that stays in memory for small tables and
+        # moves to disk for large ones, instead of building and encoding one giant string
+        with tempfile.SpooledTemporaryFile(max_size=1 << 20, mode="w+b") as html_file:
+            html_file.write(html_head.encode("UTF-8"))
+            for fragment in iter_html_table(df):
+                html_file.write(fragment.encode("UTF-8"))
+            html_file.write(html_tail.encode("UTF-8"))
+            html_file.seek(0)
+
+            if WeasyHTML is not None:
+                # Pass base_url explicitly: once the spooled file rolls over to disk its .name is
+                # an integer file descriptor, which WeasyPrint would otherwise try to use as a URL
+                WeasyHTML(file_obj=html_file, encoding="UTF-8", base_url=os.getcwd()).write_pdf(filename)
+                print(f"Data successfully saved to {filename}")
+                return
+
+            with open(filename, "wb") as pdf_file:
+                pisa_status = pisa.CreatePDF(html_file, dest=pdf_file, encoding='UTF-8')
 
         if not pisa_status.err:
             print(f"Data successfully saved to {filename}")
@@ -322,18 +646,23 @@ def list_unique_values(df: pd.DataFrame, column_name: str, display_name: str):
         print(f"{display_name} data is not available or column '{column_name}' is missing.")
         return
     
-    unique_items = df[[COLUMN_MAPPING.get('coc', 'College Code'), column_name]].drop_duplicates().sort_values(by=column_name)
     print(f"\n--- Unique {display_name} (with College Codes if applicable) ---")
-    if column_name == COLUMN_MAPPING.get('con', 'College Name'): # College Name
-        for _, row in unique_items.iterrows():
-             print(f"  Code: {row[COLUMN_MAPPING.get('coc', 'College Code')]} - Name: {row[column_name]}")
-    elif column_name == COLUMN_MAPPING.get('brn', 'Branch Name'): # Branch Name
-        unique_branches = df[[COLUMN_MAPPING.get('brc','Branch Code'), column_name]].drop_duplicates().sort_values(by=column_name)
-        for _, row in unique_branches.iterrows():
-            print(f"  Code: {row[COLUMN_MAPPING.get('brc','Branch Code')]} - Name: {row[column_name]}")
+    code_column = {
+        COLUMN_MAPPING.get('con', 'College Name'): COLUMN_MAPPING.get('coc', 'College Code'),
+        COLUMN_MAPPING.get('brn', 'Branch Name'): COLUMN_MAPPING.get('brc', 'Branch Code'),
+    }.get(column_name)
+    if code_column: # College Name or Branch Name, listed with their codes
+        unique_items = df[[code_column, column_name]].drop_duplicates().sort_values(by=column_name)
+        # Convert to plain lists once instead of boxing every row through iterrows()
+        lines = [f"  Code: {code} - Name: {name}"
+                 for code, name in zip(unique_items[code_column].tolist(), unique_items[column_name].tolist())]
     else: # Generic case
-        for item in df[column_name].unique():
-            print(f"  {item}")
+        column = df[column_name]
+        # Categorical columns already hold their distinct values as categories
+        items = column.cat.categories if isinstance(column.dtype, pd.CategoricalDtype) else column.unique()
+        lines = [f"  {item}" for item in items]
+    if lines:
+        print("\n".join(lines))
     print("--------------------------------------------------")
 
 # --- Main Execution ---
@@ -344,9 +673,10 @@ def main():
     parser.add_argument(
         "--year",
         type=int,
+        nargs='+',
         choices=YEAR_TO_API_CODE.keys(),
         required=True,
-        help="Year for which to fetch data (e.g., 2023)."
+        help="Year(s) for which to fetch data (e.g., 2023, or 2023 2024 to combine years)."
     )
 
     # --- Output Arguments (conditionally required) ---
@@ -361,6 +691,11 @@ def main():
         default='excel',
         help="Format of the output file (default: excel)."
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help=f"Ignore cached API responses in {CACHE_DIR} and download fresh data."
+    )
 
     # --- Action Arguments (alternative to output) ---
     parser.add_argument(
@@ -404,6 +739,12 @@ def main():
         default='asc',
         help="Sort order: 'asc' for ascending, 'desc' for descending (default: asc)."
     )
+    sort_group.add_argument(
+        "--top",
+        type=int,
+        help="Keep only the first N rows after sorting. When sorting by a cutoff column, "
+             "rows without that cutoff are skipped."
+    )
     
     args = parser.parse_args()
 
@@ -411,6 +752,7 @@ def main():
         print("--- Available columns for sorting (use these names with --sort-by): ---")
         for original, mapped in COLUMN_MAPPING.items():
             print(f"  - '{mapped}' (or try '{original}')")
+        print(f"  - '{YEAR_COLUMN}' (only when several years are combined)")
         print("--------------------------------------------------------------------")
         sys.exit(0)
 
@@ -418,27 +760,47 @@ def main():
     is_list_action = args.list_colleges or args.list_branches
     if not is_list_action and not args.output_file:
         parser.error("--output-file is required unless using --list-colleges or --list-branches.")
+    if args.top is not None and args.top <= 0:
+        parser.error("--top must be a positive integer.")
 
 
-    year_api_code = YEAR_TO_API_CODE.get(args.year)
-    if not year_api_code:
-        print(f"Error: Invalid year {args.year}. Supported years: {', '.join(map(str, YEAR_TO_API_CODE.keys()))}", file=sys.stderr)
-        sys.exit(1)
-
-    raw_data = fetch_tnea_data(year_api_code)
-    if raw_data is None:
-        print(f"Failed to fetch data for year {args.year}. Exiting.", file=sys.stderr)
+    years = list(dict.fromkeys(args.year)) # Drop repeated years, keep the given order
+    invalid_years = [year for year in years if year not in YEAR_TO_API_CODE]
+    if invalid_years:
+        print(f"Error: Invalid year {invalid_years[0]}. Supported years: {', '.join(map(str, YEAR_TO_API_CODE.keys()))}", file=sys.stderr)
         sys.exit(1)
-    if not raw_data:
-        print(f"No data found for year {args.year}. This might be an API issue or data not yet available.", file=sys.stderr)
-        sys.exit(0)
 
+    # Cache writes run in the background while the data is processed; leaving the
+    # block waits for them to finish
+    with ThreadPoolExecutor(max_workers=2) as cache_writer:
+        fetched = fetch_tnea_data_many([YEAR_TO_API_CODE[year] for year in years], refresh=args.refresh,
+                                       cache_executor=cache_writer)
+
+        raw_data = []
+        rows_per_year = []
+        for year in years:
+            year_data = fetched[YEAR_TO_API_CODE[year]]
+            if year_data is None:
+                print(f"Failed to fetch data for year {year}. Exiting.", file=sys.stderr)
+                sys.exit(1)
+            if not year_data:
+                print(f"No data found for year {year}. This might be an API issue or data not yet available.", file=sys.stderr)
+                continue
+            raw_data.extend(year_data)
+            rows_per_year.append((year, len(year_data)))
+        if not raw_data:
+            sys.exit(0)
+
+        df = process_data(raw_data)
 
-    df = process_data(raw_data)
     if df.empty:
         print("No data to process after initial fetch and processing. Exiting.", file=sys.stderr)
         sys.exit(0)
 
+    # Tag each row with its year when several years are combined
+    if len(rows_per_year) > 1:
+        df.insert(0, YEAR_COLUMN, np.repeat([year for year, _ in rows_per_year], [count for _, count in rows_per_year]))
+
     # Handle list actions
     if args.list_colleges:
         list_unique_values(df, COLUMN_MAPPING.get('con', 'College Name'), "Colleges")
@@ -449,12 +811,12 @@ def main():
         sys.exit(0)
 
     # Apply filters and sorting for data export
-    df_filtered = apply_filters(df.copy(), args) # Use copy to avoid modifying original df for multiple operations
+    df_filtered = apply_filters(df, args)
     if df_filtered.empty:
         print("No data matches the applied filters.", file=sys.stderr)
         sys.exit(0)
 
-    df_sorted = apply_sorting(df_filtered.copy(), args)
+    df_sorted = apply_sorting(df_filtered, args)
 
 
     # Save the data
@@ -464,11 +826,11 @@ def main():
         elif args.format == 'csv':
             save_to_csv(df_sorted, args.output_file)
         elif args.format == 'pdf':
-            if pisa:
+            if any(get_pdf_backend()):
                 save_to_pdf(df_sorted, args.output_file)
             else:
-                print("PDF generation skipped as xhtml2pdf is not available.", file=sys.stderr)
-                print("Consider saving to Excel or CSV instead, or install xhtml2pdf.", file=sys.stderr)
+                print("PDF generation skipped as neither WeasyPrint nor xhtml2pdf is available.", file=sys.stderr)
+                print("Consider saving to Excel or CSV instead, or install weasyprint or xhtml2pdf.", file=sys.stderr)
 
 if __name__ == "__main__":
     main()